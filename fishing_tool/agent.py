@@ -1,20 +1,31 @@
 from __future__ import annotations
 
+import os
+import queue
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TextIO
 
 import cv2
-import easyocr
 import mss
 import numpy as np
-import pyautogui
 import pygetwindow as gw
-from paddleocr import PaddleOCR
 
+from . import kernels
+from .input_backend import select_click_impl
 from .config import FishingConfig
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Minecraft's auto GUI scale renders 8px glyphs at roughly window_height / 240 scale.
+GUI_TEXT_HEIGHT_RATIO = 8.0 / 240.0
+
 
 @dataclass
 class TriggerResult:
@@ -23,6 +34,7 @@ class TriggerResult:
     action: Optional[str] = None
     button: Optional[str] = None
     text: str = ""
+    skipped: bool = False
 
 
 class FishingAgent:
@@ -32,23 +44,160 @@ class FishingAgent:
         self.rod_casted = False
 
         self.started_at = time.time()
-        self.cast_timestamps: list[float] = []
+        # Only recent casts are kept; totals for stats are tracked incrementally.
+        self.cast_timestamps: deque[float] = deque(maxlen=10_000)
+        self._cast_count = 0
+        self._interval_sum = 0.0
+        self._interval_count = 0
         self.next_stats_print_at = self.started_at + max(1.0, self.config.stats_print_interval_sec)
         self.last_bite_seen_at = self.started_at
         self.last_no_bite_recover_at = 0.0
         self.last_nonempty_ocr_at = self.started_at
         self.last_ocr_empty_recover_at = 0.0
+        self._stats_fp: Optional[TextIO] = None
+        self._click_impl = select_click_impl()
+        self._idle_frames = 0
+        self._poll_interval = self.config.interval_sec
+        self._pending_probe: Optional[tuple[float, str, str]] = None
+
+        self._kw_pairs = [(kw, self._normalize(kw)) for kw in self.config.keywords]
+        self._norm_button_rules = [
+            (self._normalize(key), "left" if button == "left" else "right")
+            for key, button in self.config.button_rules.items()
+        ]
+        self._norm_bite_kws = [
+            target for target in (self._normalize(kw) for kw in self.config.bite_presence_keywords) if target
+        ]
+        self._norm_cast_kw = self._normalize(self.config.cast_keyword)
+        self._norm_reel_kw = self._normalize(self.config.reel_keyword)
+
+        self._match_words = {
+            word
+            for word in (
+                *(target for _, target in self._kw_pairs),
+                *(key for key, _ in self._norm_button_rules),
+                *self._norm_bite_kws,
+                self._norm_cast_kw,
+                self._norm_reel_kw,
+            )
+            if word
+        }
+        self._ac = None
+        if ahocorasick is not None and self._match_words:
+            automaton = ahocorasick.Automaton()
+            for word in self._match_words:
+                automaton.add_word(word, word)
+            automaton.make_automaton()
+            self._ac = automaton
+
+        # The mss session is owned by the capture thread; handles are thread-bound.
+        self._sct = None
+        self._frame_q: queue.Queue = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+        self._capture_thread: Optional[threading.Thread] = None
+        self._gray_buf: Optional[np.ndarray] = None
+        self._scaled_buf: Optional[np.ndarray] = None
+        self._binary_buf: Optional[np.ndarray] = None
+        self._bin_kernel = None
+        self._last_frame_digest: Optional[int] = None
+        self._last_text = ""
+        self._cached_region: Optional[dict[str, int]] = None
+        self._region_cached_at = 0.0
+        self._region_refresh_sec = max(0.0, self.config.region_refresh_sec)
+        # 0 means unknown, which keeps the 2x upscale.
+        self._text_height_px = self.config.ocr_text_height_px or 0.0
+        if self.config.region:
+            self._cached_region = self._compute_focus_region()
 
+        # Import only the selected engine; each one is slow to load and memory heavy.
+        self.reader = None
+        self.paddle_reader = None
+        self.rapid_reader = None
         if self.config.ocr_engine == "easyocr":
-            self.reader = easyocr.Reader(config.languages, gpu=False)
-            self.paddle_reader = None
+            import easyocr
+
+            if self.config.ocr_backend != "native":
+                print(f"[WARN] ocr_backend={self.config.ocr_backend} is not supported by easyocr, using torch.")
+            # quantize applies int8 dynamic quantization to both models on CPU.
+            self.reader = easyocr.Reader(config.languages, gpu=False, quantize=self.config.quantize)
+            if self.config.speedup:
+                self._compile_easyocr_models()
+        elif self.config.ocr_backend == "onnx":
+            from rapidocr_onnxruntime import RapidOCR
+
+            self.rapid_reader = RapidOCR()
+            self._bin_kernel = self._load_bin_kernel()
+        elif self.config.ocr_backend == "openvino":
+            from rapidocr_openvino import RapidOCR
+
+            self.rapid_reader = RapidOCR()
+            self._bin_kernel = self._load_bin_kernel()
         else:
-            self.reader = None
+            from paddleocr import PaddleOCR
+
+            cpu_threads = self.config.paddle_cpu_threads
+            if cpu_threads is None or cpu_threads <= 0:
+                cpu_threads = max(1, (os.cpu_count() or 2) // 2)
             self.paddle_reader = PaddleOCR(
                 use_angle_cls=False,
                 lang=self.config.ocr_lang,
                 show_log=False,
+                enable_mkldnn=self.config.paddle_enable_mkldnn,
+                cpu_threads=cpu_threads,
+                det_db_box_thresh=0.6,
+                rec_batch_num=1,
             )
+            self._bin_kernel = self._load_bin_kernel()
+
+    def _load_bin_kernel(self) -> Optional[Callable[[np.ndarray, np.ndarray, float], None]]:
+        # The fused kernel only runs for small frames with a fixed threshold and no upscale,
+        # which is only known up front for a static region with an explicit text height.
+        # Skip importing and compiling numba for every other setup.
+        region = self._cached_region
+        text_height = self.config.ocr_text_height_px
+        if (
+            not self.config.region
+            or region is None
+            or region["width"] * region["height"] >= kernels.SMALL_REGION_MAX_PIXELS
+            or self.config.ocr_threshold_mode == "otsu"
+            or not text_height
+            or text_height < self.config.ocr_upscale_below_text_px
+        ):
+            return None
+        return kernels.load_bgra_to_bin()
+
+    def _compile_easyocr_models(self) -> None:
+        import torch
+
+        if not hasattr(torch, "compile"):
+            print("[WARN] speedup requires torch>=2.0, running eager models.")
+            return
+
+        if self._cached_region is not None:
+            h, w = self._cached_region["height"], self._cached_region["width"]
+        else:
+            h, w = 64, 480
+
+        eager_detector = self.reader.detector
+        eager_recognizer = self.reader.recognizer
+        try:
+            # A static region fixes the detector input shape; recognizer crops vary in width.
+            self.reader.detector = torch.compile(
+                eager_detector,
+                dynamic=False if self._cached_region is not None else None,
+            )
+            self.reader.recognizer = torch.compile(eager_recognizer)
+
+            # torch.compile is lazy, so run both models now to surface compile errors here.
+            # Rendered text gives the detector boxes; recognize() always runs the recognizer.
+            warmup = np.zeros((h, w, 3), dtype=np.uint8)
+            cv2.putText(warmup, "Bobber splashes", (4, h // 2), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+            self.reader.readtext(warmup, detail=0)
+            self.reader.recognize(cv2.cvtColor(warmup, cv2.COLOR_BGR2GRAY), detail=0)
+        except Exception as e:
+            self.reader.detector = eager_detector
+            self.reader.recognizer = eager_recognizer
+            print(f"[WARN] speedup disabled, torch.compile failed ({e}); running eager models.")
 
     def _normalize(self, text: str) -> str:
         if self.config.case_sensitive:
@@ -64,8 +213,7 @@ class FishingAgent:
                 raise RuntimeError(f"Window not found: {self.config.window_title_contains}")
             w = windows[0]
             return {"left": w.left, "top": w.top, "width": w.width, "height": w.height}
-        with mss.mss() as sct:
-            monitor = sct.monitors[1]
+        monitor = self._sct.monitors[1]
         return {
             "left": monitor["left"],
             "top": monitor["top"],
@@ -74,7 +222,23 @@ class FishingAgent:
         }
 
     def _focus_region(self) -> dict[str, int]:
+        if self._cached_region is not None:
+            if self.config.region:
+                return self._cached_region
+            now = time.time()
+            if now - self._region_cached_at < self._region_refresh_sec:
+                return self._cached_region
+
+        self._cached_region = self._compute_focus_region()
+        self._region_cached_at = time.time()
+        return self._cached_region
+
+    def _compute_focus_region(self) -> dict[str, int]:
         base = self._window_region()
+        # The GUI-scale estimate only holds when base is the whole game window or monitor;
+        # a static region is an arbitrary crop, so it relies on ocr_text_height_px instead.
+        if not self.config.region and not self.config.ocr_text_height_px:
+            self._text_height_px = base["height"] * GUI_TEXT_HEIGHT_RATIO
         ratio = self.config.focus_region_ratio
         if not ratio:
             return base
@@ -96,12 +260,83 @@ class FishingAgent:
             return []
         return self.reader.readtext(img, detail=0, paragraph=True)
 
+    @staticmethod
+    def _reuse_buffer(buf: Optional[np.ndarray], shape: tuple[int, int]) -> np.ndarray:
+        if buf is None or buf.shape != shape:
+            return np.empty(shape, dtype=np.uint8)
+        return buf
+
+    def _preprocess_for_paddle(self, img: np.ndarray) -> np.ndarray:
+        # Output buffers are reused across ticks while the region size is stable, so the
+        # returned array is only valid until the next call.
+        h, w = img.shape[:2]
+        upscale = self._text_height_px < self.config.ocr_upscale_below_text_px
+        if (
+            self._bin_kernel is not None
+            and not upscale
+            and self.config.ocr_threshold_mode != "otsu"
+            and h * w < kernels.SMALL_REGION_MAX_PIXELS
+        ):
+            self._binary_buf = self._reuse_buffer(self._binary_buf, (h, w))
+            self._bin_kernel(img, self._binary_buf, float(self.config.ocr_fixed_threshold))
+            return self._binary_buf
+
+        self._gray_buf = self._reuse_buffer(self._gray_buf, (h, w))
+        # Convert straight from the contiguous BGRA view: slicing to BGR would make
+        # OpenCV copy the non-contiguous array before converting.
+        gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY, dst=self._gray_buf)
+        if upscale:
+            self._scaled_buf = self._reuse_buffer(self._scaled_buf, (h * 2, w * 2))
+            scaled = cv2.resize(
+                gray,
+                (w * 2, h * 2),
+                dst=self._scaled_buf,
+                interpolation=cv2.INTER_LINEAR,
+            )
+        else:
+            scaled = gray
+        self._binary_buf = self._reuse_buffer(self._binary_buf, scaled.shape[:2])
+        if self.config.ocr_threshold_mode == "otsu":
+            binary = cv2.threshold(
+                scaled, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=self._binary_buf
+            )[1]
+        else:
+            binary = cv2.threshold(
+                scaled, self.config.ocr_fixed_threshold, 255, cv2.THRESH_BINARY, dst=self._binary_buf
+            )[1]
+        return binary
+
+    def _ocr_with_rapid(self, img: np.ndarray) -> list[str]:
+        if self.rapid_reader is None:
+            return []
+        binary = self._preprocess_for_paddle(img)
+        if self.config.skip_detection:
+            result, _ = self.rapid_reader(binary, use_det=False, use_cls=False, use_rec=True)
+            # Recognition-only results are [text, score] instead of [box, text, score].
+            text_idx = 0
+        else:
+            result, _ = self.rapid_reader(binary)
+            text_idx = 1
+
+        texts: list[str] = []
+        if not result:
+            return texts
+
+        for item in result:
+            if not item or len(item) <= text_idx:
+                continue
+            texts.append(str(item[text_idx]))
+        return texts
+
     def _ocr_with_paddle(self, img: np.ndarray) -> list[str]:
         if self.paddle_reader is None:
             return []
-        gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY)
-        scaled = cv2.resize(gray, None, fx=2.0, fy=2.0, interpolation=cv2.INTER_CUBIC)
-        binary = cv2.threshold(scaled, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+        binary = self._preprocess_for_paddle(img)
+        if self.config.skip_detection:
+            result = self.paddle_reader.ocr(binary, det=False, cls=False)
+            # Recognition-only results are [(text, score), ...] per image.
+            return [str(item[0]) for line in result or [] if line for item in line if item]
+
         result = self.paddle_reader.ocr(binary, cls=False)
 
         texts: list[str] = []
@@ -119,33 +354,131 @@ class FishingAgent:
                     texts.append(str(text_info[0]))
         return texts
 
-    def capture_text(self) -> str:
+    def _grab_frame(self) -> tuple[np.ndarray, int, float]:
         region = self._focus_region()
-        with mss.mss() as sct:
-            shot = sct.grab(region)
-        img = np.array(shot)
+        grabbed_at = time.time()
+        shot = self._sct.grab(region)
+        # View over the screenshot's raw BGRA buffer (no copy). Each grab returns a new
+        # buffer, so the view stays valid after it is handed to the OCR thread.
+        img = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+        # Hash a downsampled thumbnail so identical (or near-identical) frames skip OCR.
+        thumb = cv2.resize(img, (64, 64), interpolation=cv2.INTER_AREA)
+        digest = hash((img.shape, thumb.tobytes()))
+        return img, digest, grabbed_at
+
+    def _publish_frame(self, frame: tuple[np.ndarray, int, float] | Exception) -> None:
+        while True:
+            try:
+                self._frame_q.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self._frame_q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _capture_worker(self) -> None:
+        # Setup failures (no display, DC errors) are forwarded like grab errors; the thread
+        # then exits and _start_capture retries on the next frame request.
+        try:
+            self._sct = mss.mss()
+        except Exception as e:
+            self._publish_frame(e)
+            return
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self._publish_frame(self._grab_frame())
+                except Exception as e:
+                    self._publish_frame(e)
+                    self._stop_event.wait(max(self.config.interval_sec, 0.2))
+                    continue
+                self._stop_event.wait(self._poll_interval)
+        finally:
+            self._sct.close()
+            self._sct = None
+
+    def _start_capture(self) -> None:
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._capture_thread = threading.Thread(
+            target=self._capture_worker,
+            name="fishing-capture",
+            daemon=True,
+        )
+        self._capture_thread.start()
+
+    def _next_frame(self) -> tuple[np.ndarray, int, float]:
+        self._start_capture()
+        # Short timeouts keep the wait interruptible by Ctrl+C.
+        deadline = time.time() + max(2.0, self._poll_interval * 10)
+        while True:
+            try:
+                frame = self._frame_q.get(timeout=0.2)
+                break
+            except queue.Empty:
+                if time.time() >= deadline:
+                    raise RuntimeError("No frame captured in time")
+
+        if isinstance(frame, Exception):
+            raise frame
+        return frame
+
+    def _probe_ready_at(self) -> Optional[float]:
+        if self._pending_probe is None:
+            return None
+        return self._pending_probe[0] + max(0.05, self.config.smart_recover_probe_wait_sec)
+
+    def capture_text(self) -> Optional[str]:
+        img, digest, grabbed_at = self._next_frame()
+        # A pending probe must only see frames grabbed after its click has taken effect;
+        # None means no eligible frame yet.
+        ready_at = self._probe_ready_at()
+        if ready_at is not None and grabbed_at < ready_at:
+            return None
+        if digest == self._last_frame_digest:
+            return self._last_text
 
         if self.config.ocr_engine == "easyocr":
-            texts = self._ocr_with_easyocr(img)
+            texts = self._ocr_with_easyocr(img[..., :3])
+        elif self.rapid_reader is not None:
+            texts = self._ocr_with_rapid(img)
         else:
             texts = self._ocr_with_paddle(img)
 
-        return " ".join(texts).strip()
+        text = " ".join(texts).strip()
+        self._last_frame_digest = digest
+        self._last_text = text
+        return text
 
-    def _select_button(self, normalized_text: str) -> str:
-        for key, button in self.config.button_rules.items():
-            k = key if self.config.case_sensitive else key.lower()
-            if k in normalized_text:
-                return "left" if button == "left" else "right"
+    def _find_hits(self, normalized_text: str) -> set[str]:
+        if self._ac is not None:
+            return {word for _, word in self._ac.iter(normalized_text)}
+        return {word for word in self._match_words if word in normalized_text}
+
+    def _select_button(self, hits: set[str]) -> str:
+        for key, button in self._norm_button_rules:
+            if key in hits:
+                return button
         return "left" if self.config.default_button == "left" else "right"
 
     def _click(self, button: str) -> None:
-        pyautogui.click(button=button)
+        self._click_impl(button)
 
     def _cast_once(self, button: str) -> None:
         self._click(button)
         self.rod_casted = True
-        self.cast_timestamps.append(time.time())
+        self._record_cast(time.time())
+
+    def _record_cast(self, ts: float) -> None:
+        if self.cast_timestamps:
+            self._interval_sum += ts - self.cast_timestamps[-1]
+            self._interval_count += 1
+        self.cast_timestamps.append(ts)
+        self._cast_count += 1
 
     def _reel_once(self, button: str) -> None:
         self._click(button)
@@ -156,12 +489,10 @@ class FishingAgent:
         time.sleep(self.config.recast_delay_sec)
         self._cast_once(button)
 
-    def _sync_state_from_text(self, normalized_text: str) -> None:
-        cast_kw = self._normalize(self.config.cast_keyword)
-        reel_kw = self._normalize(self.config.reel_keyword)
-        if cast_kw and cast_kw in normalized_text:
+    def _sync_state_from_hits(self, hits: set[str]) -> None:
+        if self._norm_cast_kw in hits:
             self.rod_casted = True
-        if reel_kw and reel_kw in normalized_text:
+        if self._norm_reel_kw in hits:
             self.rod_casted = False
 
     def _resolve_action(self, matched_keyword: str) -> str:
@@ -171,17 +502,12 @@ class FishingAgent:
         return action
 
     def _stats_snapshot(self) -> tuple[int, float, float]:
-        cast_count = len(self.cast_timestamps)
         runtime = max(0.0, time.time() - self.started_at)
-        if cast_count < 2:
-            avg_cast_interval = 0.0
+        if self._interval_count:
+            avg_cast_interval = self._interval_sum / self._interval_count
         else:
-            intervals = [
-                self.cast_timestamps[i] - self.cast_timestamps[i - 1]
-                for i in range(1, cast_count)
-            ]
-            avg_cast_interval = sum(intervals) / len(intervals)
-        return cast_count, avg_cast_interval, runtime
+            avg_cast_interval = 0.0
+        return self._cast_count, avg_cast_interval, runtime
 
     def _emit_stats(self, final: bool = False) -> None:
         cast_count, avg_cast_interval, runtime = self._stats_snapshot()
@@ -193,17 +519,17 @@ class FishingAgent:
         print(msg)
 
         if self.config.stats_log_file:
-            log_path = Path(self.config.stats_log_file)
-            if not log_path.is_absolute():
-                log_path = Path.cwd() / log_path
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
-
-    def _touch_bite_presence(self, normalized_text: str) -> None:
-        for kw in self.config.bite_presence_keywords:
-            target = kw if self.config.case_sensitive else kw.lower()
-            if target and target in normalized_text:
+            if self._stats_fp is None:
+                log_path = Path(self.config.stats_log_file)
+                if not log_path.is_absolute():
+                    log_path = Path.cwd() / log_path
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._stats_fp = open(log_path, "a", encoding="utf-8", buffering=1)
+            self._stats_fp.write(msg + "\n")
+
+    def _touch_bite_presence(self, hits: set[str]) -> None:
+        for target in self._norm_bite_kws:
+            if target in hits:
                 self.last_bite_seen_at = time.time()
                 return
 
@@ -214,37 +540,11 @@ class FishingAgent:
             self._recast(button)
             recover_note = "recast"
         elif action == "smart_recover":
-            probe_click_at = time.time()
+            # The probe result is read from the main loop's next OCR pass (see step)
+            # instead of running a second OCR on this tick.
             self._click(button)
-            time.sleep(max(0.05, self.config.smart_recover_probe_wait_sec))
-
-            probe_text = self.capture_text()
-            if self.config.print_ocr_text:
-                print(f"[OCR-PROBE] {probe_text}")
-            if probe_text.strip():
-                self.last_nonempty_ocr_at = time.time()
-
-            probe_normalized = self._normalize(probe_text)
-            self._sync_state_from_text(probe_normalized)
-            self._touch_bite_presence(probe_normalized)
-
-            cast_kw = self._normalize(self.config.cast_keyword)
-            reel_kw = self._normalize(self.config.reel_keyword)
-            cast_hit = cast_kw and cast_kw in probe_normalized
-            reel_hit = reel_kw and reel_kw in probe_normalized
-
-            if reel_hit:
-                self._cast_once(button)
-                recover_note = "smart_recover(retrieved_then_cast)"
-            elif cast_hit:
-                self.rod_casted = True
-                self.cast_timestamps.append(probe_click_at)
-                recover_note = "smart_recover(thrown_ok)"
-            elif not self.rod_casted:
-                self._cast_once(button)
-                recover_note = "smart_recover(unknown_then_cast)"
-            else:
-                recover_note = "smart_recover(unknown_keep)"
+            self._pending_probe = (time.time(), button, reason_tag)
+            return
         elif action == "cast_if_idle":
             if not self.rod_casted:
                 self._cast_once(button)
@@ -257,9 +557,30 @@ class FishingAgent:
 
         print(f"[RECOVER] {reason_tag} action={recover_note}")
 
+    def _resolve_probe(self, text: str, hits: set[str]) -> None:
+        probe_click_at, button, reason_tag = self._pending_probe
+        self._pending_probe = None
+        if self.config.print_ocr_text:
+            print(f"[OCR-PROBE] {text}")
+
+        if self._norm_reel_kw in hits:
+            self._cast_once(button)
+            recover_note = "smart_recover(retrieved_then_cast)"
+        elif self._norm_cast_kw in hits:
+            self.rod_casted = True
+            self._record_cast(probe_click_at)
+            recover_note = "smart_recover(thrown_ok)"
+        elif not self.rod_casted:
+            self._cast_once(button)
+            recover_note = "smart_recover(unknown_then_cast)"
+        else:
+            recover_note = "smart_recover(unknown_keep)"
+
+        print(f"[RECOVER] {reason_tag} action={recover_note}")
+
     def _handle_no_bite_timeout(self) -> None:
         timeout = self.config.no_bite_timeout_sec
-        if timeout is None or timeout <= 0:
+        if timeout is None or timeout <= 0 or self._pending_probe is not None:
             return
 
         now = time.time()
@@ -276,7 +597,7 @@ class FishingAgent:
 
     def _handle_ocr_empty_timeout(self) -> None:
         timeout = self.config.ocr_empty_timeout_sec
-        if timeout is None or timeout <= 0:
+        if timeout is None or timeout <= 0 or self._pending_probe is not None:
             return
 
         now = time.time()
@@ -291,21 +612,41 @@ class FishingAgent:
         self.last_ocr_empty_recover_at = now
         self.last_nonempty_ocr_at = now
 
+    def _update_poll_interval(self, result: TriggerResult) -> float:
+        if result.matched or result.text.strip():
+            self._idle_frames = 0
+        else:
+            self._idle_frames += 1
+
+        base = self.config.interval_sec
+        factor = self.config.idle_backoff_factor
+        if factor <= 1.0 or self._idle_frames < self.config.idle_backoff_frames:
+            self._poll_interval = base
+        else:
+            steps = min(self._idle_frames // max(1, self.config.idle_backoff_frames), 16)
+            self._poll_interval = max(base, min(base * factor**steps, self.config.idle_backoff_max_sec))
+        return self._poll_interval
+
     def step(self) -> TriggerResult:
         text = self.capture_text()
+        if text is None:
+            return TriggerResult(matched=False, skipped=True)
         if self.config.print_ocr_text:
             print(f"[OCR] {text}")
 
         if text.strip():
             self.last_nonempty_ocr_at = time.time()
 
-        normalized_text = self._normalize(text)
-        self._sync_state_from_text(normalized_text)
-        self._touch_bite_presence(normalized_text)
+        hits = self._find_hits(self._normalize(text))
+        self._sync_state_from_hits(hits)
+        self._touch_bite_presence(hits)
+
+        # capture_text only returns text for a pending probe once the frame is eligible.
+        if self._pending_probe is not None:
+            self._resolve_probe(text, hits)
 
-        for kw in self.config.keywords:
-            target = kw if self.config.case_sensitive else kw.lower()
-            if target not in normalized_text:
+        for kw, target in self._kw_pairs:
+            if target not in hits:
                 continue
 
             now = time.time()
@@ -313,7 +654,7 @@ class FishingAgent:
                 return TriggerResult(matched=False, text=text)
 
             action = self._resolve_action(kw)
-            button = self._select_button(normalized_text)
+            button = self._select_button(hits)
 
             if action == "recast":
                 self._recast(button)
@@ -325,6 +666,9 @@ class FishingAgent:
             else:
                 self._click(button)
 
+            # The keyword action supersedes an unresolved probe; resolving it later would
+            # record a cast older than the one just made.
+            self._pending_probe = None
             self.last_trigger_time = now
             self.last_bite_seen_at = now
             return TriggerResult(
@@ -337,7 +681,23 @@ class FishingAgent:
 
         return TriggerResult(matched=False, text=text)
 
+    def close(self) -> None:
+        self._stop_event.set()
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=2.0)
+            self._capture_thread = None
+        if self._stats_fp is not None:
+            self._stats_fp.close()
+            self._stats_fp = None
+
     def run(self) -> None:
+        self._start_capture()
+        try:
+            self._run_loop()
+        finally:
+            self.close()
+
+    def _run_loop(self) -> None:
         print("FishingAgent started. Press Ctrl+C to stop.")
 
         start_button = "left" if self.config.default_button == "left" else "right"
@@ -361,7 +721,10 @@ class FishingAgent:
                 if now >= self.next_stats_print_at:
                     self._emit_stats(final=False)
                     self.next_stats_print_at = now + max(1.0, self.config.stats_print_interval_sec)
-                time.sleep(self.config.interval_sec)
+                # No sleep here: the capture worker paces the loop and _next_frame blocks
+                # until the next frame, so OCR always runs on the freshest capture.
+                if not result.skipped:
+                    self._update_poll_interval(result)
             except KeyboardInterrupt:
                 self._emit_stats(final=True)
                 print("Stopped.")
@@ -15,14 +15,28 @@ class FishingConfig:
     window_title_contains: Optional[str]
     region: Optional[dict[str, int]]
     focus_region_ratio: Optional[dict[str, float]]
+    region_refresh_sec: float
     cast_keyword: str
     reel_keyword: str
     interval_sec: float
+    idle_backoff_frames: int
+    idle_backoff_factor: float
+    idle_backoff_max_sec: float
     cooldown_sec: float
     recast_delay_sec: float
     languages: list[str]
     ocr_engine: str
     ocr_lang: str
+    ocr_backend: str
+    skip_detection: bool
+    speedup: bool
+    quantize: bool
+    paddle_enable_mkldnn: bool
+    paddle_cpu_threads: Optional[int]
+    ocr_upscale_below_text_px: float
+    ocr_text_height_px: Optional[float]
+    ocr_threshold_mode: str
+    ocr_fixed_threshold: float
     print_ocr_text: bool
     case_sensitive: bool
     stats_log_file: Optional[str]
@@ -41,6 +55,11 @@ class FishingConfig:
         with open(path, "r", encoding="utf-8-sig") as f:
             data = json.load(f)
 
+        ocr_text_height_raw = data.get("ocr_text_height_px")
+        ocr_text_height_px = None if ocr_text_height_raw is None else float(ocr_text_height_raw)
+        paddle_cpu_threads_raw = data.get("paddle_cpu_threads")
+        paddle_cpu_threads = None if paddle_cpu_threads_raw is None else int(paddle_cpu_threads_raw)
+
         no_bite_timeout_raw = data.get("no_bite_timeout_sec")
         no_bite_timeout_sec = None if no_bite_timeout_raw is None else float(no_bite_timeout_raw)
         ocr_empty_timeout_raw = data.get("ocr_empty_timeout_sec")
@@ -54,14 +73,28 @@ class FishingConfig:
             window_title_contains=data.get("window_title_contains"),
             region=data.get("region"),
             focus_region_ratio=data.get("focus_region_ratio"),
+            region_refresh_sec=float(data.get("region_refresh_sec", 2.0)),
             cast_keyword=data.get("cast_keyword", "Bobber thrown"),
             reel_keyword=data.get("reel_keyword", "Bobber retrieved"),
             interval_sec=float(data.get("interval_sec", 0.1)),
+            idle_backoff_frames=int(data.get("idle_backoff_frames", 5)),
+            idle_backoff_factor=float(data.get("idle_backoff_factor", 2.0)),
+            idle_backoff_max_sec=float(data.get("idle_backoff_max_sec", 0.8)),
             cooldown_sec=float(data.get("cooldown_sec", 0.5)),
             recast_delay_sec=float(data.get("recast_delay_sec", 0.25)),
             languages=data.get("languages", ["en"]),
             ocr_engine=str(data.get("ocr_engine", "paddleocr")).lower(),
             ocr_lang=str(data.get("ocr_lang", "en")),
+            ocr_backend=str(data.get("ocr_backend", "native")).lower(),
+            skip_detection=bool(data.get("skip_detection", False)),
+            speedup=bool(data.get("speedup", False)),
+            quantize=bool(data.get("quantize", True)),
+            paddle_enable_mkldnn=bool(data.get("paddle_enable_mkldnn", True)),
+            paddle_cpu_threads=paddle_cpu_threads,
+            ocr_upscale_below_text_px=float(data.get("ocr_upscale_below_text_px", 32.0)),
+            ocr_text_height_px=ocr_text_height_px,
+            ocr_threshold_mode=str(data.get("ocr_threshold_mode", "fixed")).lower(),
+            ocr_fixed_threshold=float(data.get("ocr_fixed_threshold", 180.0)),
             print_ocr_text=bool(data.get("print_ocr_text", False)),
             case_sensitive=bool(data.get("case_sensitive", False)),
             stats_log_file=data.get("stats_log_file"),
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import ctypes
+import sys
+from typing import Callable
+
+import pyautogui
+
+ClickImpl = Callable[[str], None]
+
+INPUT_MOUSE = 0
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUT(ctypes.Structure):
+    # MOUSEINPUT is the largest member of the INPUT union, so it fixes the struct size.
+    _fields_ = [("type", ctypes.c_ulong), ("mi", _MOUSEINPUT)]
+
+
+def _pyautogui_click(button: str) -> None:
+    pyautogui.click(button=button)
+
+
+def _make_sendinput_click() -> ClickImpl:
+    send_input = ctypes.windll.user32.SendInput
+    flags = {
+        "left": (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP),
+        "right": (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP),
+    }
+
+    def click(button: str) -> None:
+        pyautogui.failSafeCheck()
+        down, up = flags["left" if button == "left" else "right"]
+        inputs = (_INPUT * 2)(
+            _INPUT(type=INPUT_MOUSE, mi=_MOUSEINPUT(dwFlags=down)),
+            _INPUT(type=INPUT_MOUSE, mi=_MOUSEINPUT(dwFlags=up)),
+        )
+        if send_input(2, inputs, ctypes.sizeof(_INPUT)) != 2:
+            raise ctypes.WinError()
+
+    return click
+
+
+def select_click_impl() -> ClickImpl:
+    # pyautogui is the fallback: it adds a PAUSE sleep per call. The native path skips
+    # that sleep but keeps its corner failsafe via failSafeCheck (honors pyautogui.FAILSAFE).
+    try:
+        if sys.platform == "win32":
+            return _make_sendinput_click()
+    except Exception as e:
+        print(f"[WARN] native click backend unavailable ({e}), using pyautogui.")
+    return _pyautogui_click
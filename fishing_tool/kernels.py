@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+
+# Fused kernels only pay off below this many pixels; larger frames go through OpenCV.
+SMALL_REGION_MAX_PIXELS = 32_000
+
+
+def _bgra_to_bin(img: np.ndarray, out: np.ndarray, thr: float) -> None:
+    h, w = out.shape
+    for y in range(h):
+        for x in range(w):
+            luma = 0.114 * img[y, x, 0] + 0.587 * img[y, x, 1] + 0.299 * img[y, x, 2]
+            out[y, x] = 255 if luma > thr else 0
+
+
+def load_bgra_to_bin() -> Optional[Callable[[np.ndarray, np.ndarray, float], None]]:
+    # numba is optional and slow to import, so it is only loaded when the paddle path needs it.
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    kernel = numba.njit(cache=True, fastmath=True)(_bgra_to_bin)
+    # Compile up front so JIT cost doesn't land on the first tick.
+    kernel(np.zeros((1, 1, 4), dtype=np.uint8), np.empty((1, 1), dtype=np.uint8), 0.0)
+    return kernel